@@ -1,6 +1,8 @@
 import importlib.resources as pkg_resources
+from pathlib import Path
 from tests import contracts
 
 
-def contract_path(contract_name: str):
-    return pkg_resources.path(contracts, contract_name)
+def contract_path(contract_name: str) -> Path:
+    # INFO: files() gives a real Path for a regular package, path() is a context manager without .open
+    return pkg_resources.files(contracts) / contract_name
@@ -0,0 +1,48 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from web3.middleware import Middleware
+
+# INFO: seconds a cached response stays valid, None never expires
+RPC_CACHE_TTL = {
+    "zks_L1ChainId": None,
+    "zks_getBridgeContracts": 3600,
+    "zks_getConfirmedTokens": 300,
+}
+
+
+def build_rpc_cache_middleware(db: sqlite3.Connection,
+                               scope: tuple,
+                               ttl: Dict[str, Optional[float]] = None) -> Middleware:
+    """
+    INFO: persists stable zks_* responses between test runs, keyed by (method, params, scope).
+          Scope must identify the node state (endpoint, chain id, genesis block hash),
+          so a reset node never gets answers cached for its previous incarnation
+    """
+    if ttl is None:
+        ttl = RPC_CACHE_TTL
+    lock = threading.Lock()
+    db.execute("CREATE TABLE IF NOT EXISTS rpc_responses (key TEXT PRIMARY KEY, expires REAL, response TEXT)")
+    db.commit()
+
+    def rpc_cache_middleware(make_request, w3):
+        def middleware(method, params):
+            if method not in ttl:
+                return make_request(method, params)
+            key = json.dumps([method, params, *scope])
+            with lock:
+                row = db.execute("SELECT expires, response FROM rpc_responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and (row[0] is None or row[0] > time.time()):
+                return json.loads(row[1])
+            response = make_request(method, params)
+            if "error" not in response:
+                expires = None if ttl[method] is None else time.time() + ttl[method]
+                with lock:
+                    db.execute("INSERT OR REPLACE INTO rpc_responses VALUES (?, ?, ?)",
+                               (key, expires, json.dumps(response)))
+                    db.commit()
+            return response
+        return middleware
+    return rpc_cache_middleware
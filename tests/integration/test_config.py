@@ -30,5 +30,10 @@ class TestEnvironment:
     eth_server: str
 
 
+# INFO: environment settings of the integration tests:
+#       ZKSYNC_KEY1         - hex private key of the funded test account (required)
+#       ZKSYNC_RPC_CACHE    - path of a sqlite file, enables caching of stable zks_* responses between runs
+#       ZKSYNC_READ_SERVERS - comma separated extra zkSync nodes of the same chain (e.g. archival),
+#                             heavy read calls are spread over them together with zksync_server
 LOCAL_ENV = TestEnvironment(EnvType.LOCAL_HOST, "http://127.0.0.1:3050", "http://127.0.0.1:8545")
 TESTNET = TestEnvironment(EnvType.TESTNET, "https://zksync2-testnet.zksync.dev", "https://rpc.ankr.com/eth_goerli")
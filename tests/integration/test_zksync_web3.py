@@ -1,43 +1,140 @@
+import itertools
+import logging
 import os
+import sqlite3
+from hashlib import sha256
+from pprint import pformat
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from functools import lru_cache
 from unittest import TestCase, skip
-from eth_typing import HexStr
+from eth_abi import encode
+from eth_typing import HexStr, URI
+from requests import Session
+from requests.adapters import HTTPAdapter
 from web3 import Web3
-from web3.types import TxParams
+from web3._utils.request import cache_and_return_session
+from web3.types import TxParams, RPCEndpoint
 from web3.middleware import geth_poa_middleware
-from zksync2.core.utils import to_bytes
+from zksync2.core.utils import hash_byte_code
 from zksync2.manage_contracts.precompute_contract_deployer import PrecomputeContractDeployer
-from zksync2.manage_contracts.contract_encoder_base import ContractEncoder
+from zksync2.manage_contracts.contract_encoder_base import ContractEncoder, JsonConfiguration
 from zksync2.manage_contracts.contract_factory import LegacyContractFactory
-from zksync2.manage_contracts.erc20_contract import ERC20Encoder, ERC20Contract
+from zksync2.manage_contracts.erc20_contract import ERC20Contract
 from zksync2.manage_contracts.nonce_holder import NonceHolder
 from zksync2.module.module_builder import ZkSyncBuilder
+from zksync2.module.zksync_module import ZKSYNC_RESULT_FORMATTERS, zks_get_all_account_balances_rpc, \
+    zks_get_confirmed_tokens_rpc, zks_get_token_price_rpc, zks_l1_chain_id_rpc, zks_get_bridge_contracts_rpc
+from zksync2.module.zksync_provider import ZkSyncProvider
 from zksync2.core.types import Token, ZkBlockParams, EthBlockParams, ADDRESS_DEFAULT
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from zksync2.provider.eth_provider import EthereumProvider
 from zksync2.signer.eth_signer import PrivateKeyEthSigner
 from tests.contracts.utils import contract_path
+from tests.integration.rpc_cache import build_rpc_cache_middleware
 from zksync2.transaction.transaction_builders import TxFunctionCall, TxCreateContract, TxCreate2Contract, TxWithdraw
 from test_config import LOCAL_ENV, EnvType, EnvPrivateKey
 
 
-def generate_random_salt() -> bytes:
-    return os.urandom(32)
+logger = logging.getLogger(__name__)
+
+LATEST_BLOCK = EthBlockParams.LATEST.value
+
+_SALT_RUN_PREFIX = os.urandom(16)
+
+
+def generate_random_salt(seed: bytes = b'') -> bytes:
+    """
+    INFO: salts derived from the same seed are stable for the whole test run,
+          run prefix keeps CREATE2 addresses unique between runs on the same node
+    """
+    if not seed:
+        return os.urandom(32)
+    return sha256(_SALT_RUN_PREFIX + seed).digest()
+
+
+# INFO: keccak("transfer(address,uint256)")[:4]
+_ERC20_TRANSFER_SELECTOR = bytes.fromhex("a9059cbb")
+# INFO: keccak("balanceOf(address)")[:4]
+_ERC20_BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+
+def encode_erc20_transfer(to: HexStr, amount: int) -> HexStr:
+    encoded = _ERC20_TRANSFER_SELECTOR + encode(["address", "uint256"], [to, amount])
+    return HexStr("0x" + encoded.hex())
+
+
+def encode_erc20_balance_of(owner: HexStr) -> HexStr:
+    encoded = _ERC20_BALANCE_OF_SELECTOR + encode(["address"], [owner])
+    return HexStr("0x" + encoded.hex())
+
+
+def _dump(label: str, value) -> None:
+    # INFO: compact multi-item lines keep captured CI logs small, formatting is skipped unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", label, pformat(value, compact=True, width=160))
+
+
+def decode_int256(word: bytes) -> int:
+    # INFO: single C call, faster than struct unpacking or eth_abi decode for a bare 32-byte word
+    return int.from_bytes(word, "big", signed=True)
 
 
 class ZkSyncWeb3Tests(TestCase):
     ETH_TOKEN = Token.create_eth()
     ETH_TEST_NET_AMOUNT_BALANCE = Decimal(1)
+    # INFO: Counter deployed by any test is reused by test_execute_contract
+    counter_address = None
+    # INFO: upper bound of concurrent requests to the node, shared by worker pool and connection pool
+    MAX_INFLIGHT = 16
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.env = LOCAL_ENV
+        # INFO: one keep-alive session for every call, requests over MAX_INFLIGHT wait for a free connection
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=cls.MAX_INFLIGHT,
+                              pool_maxsize=cls.MAX_INFLIGHT,
+                              pool_block=True,
+                              max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        cls.web3 = ZkSyncBuilder.build(cls.env.zksync_server, session=session)
+        cls.zksync_provider = ZkSyncProvider(cls.env.zksync_server, session=session)
+        # INFO: web3 caches sessions per thread, register the same one for every worker
+        cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_INFLIGHT,
+                                           initializer=cache_and_return_session,
+                                           initargs=(URI(cls.env.zksync_server), session))
+        cls.chain_id = cls.web3.zksync.chain_id
+        # INFO: heavy reads are spread over extra nodes, see ZKSYNC_READ_SERVERS in test_config
+        read_servers = [url for url in os.getenv("ZKSYNC_READ_SERVERS", "").split(",") if url]
+        readers = [ZkSyncBuilder.build(url) for url in read_servers]
+        for url, reader in zip(read_servers, readers):
+            reader_chain_id = reader.zksync.chain_id
+            if reader_chain_id != cls.chain_id:
+                raise ValueError(f"Read server {url} is on chain {reader_chain_id}, expected {cls.chain_id}")
+        cls._read_pool = itertools.cycle([cls.web3] + readers)
+        # INFO: on-disk RPC cache is opt-in, see ZKSYNC_RPC_CACHE in test_config
+        cls._rpc_cache_db = None
+        rpc_cache_path = os.getenv("ZKSYNC_RPC_CACHE")
+        if rpc_cache_path:
+            genesis_hash = cls.web3.zksync.get_block(0)["hash"].hex()
+            cls._rpc_cache_db = sqlite3.connect(rpc_cache_path, check_same_thread=False)
+            scope = (cls.env.zksync_server, cls.chain_id, genesis_hash)
+            cls.web3.middleware_onion.add(build_rpc_cache_middleware(cls._rpc_cache_db, scope))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._executor.shutdown()
+        if cls._rpc_cache_db is not None:
+            cls._rpc_cache_db.close()
 
     def setUp(self) -> None:
-        self.env = LOCAL_ENV
-        self.web3 = ZkSyncBuilder.build(self.env.zksync_server)
+        self.zks = self.web3.zksync
         env_key = EnvPrivateKey("ZKSYNC_KEY1")
         self.account: LocalAccount = Account.from_key(env_key.key)
-        self.chain_id = self.web3.zksync.chain_id
         self.signer = PrivateKeyEthSigner(self.account, self.chain_id)
-        self.counter_address = None
         self.test_tx_hash = None
         # INFO: use deploy_erc20_token_builder to get new address
         if self.env.type == EnvType.LOCAL_HOST:
@@ -50,6 +147,64 @@ class ZkSyncWeb3Tests(TestCase):
                                  symbol="SERC20",
                                  decimals=18)
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _load(cls, name: str) -> ContractEncoder:
+        # INFO: artifacts are parsed on first use only, read-only tests never touch them
+        return ContractEncoder.from_json(cls.web3, contract_path(name), JsonConfiguration.STANDARD)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _counter_get_data(cls) -> HexStr:
+        return cls._load("Counter.json").encode_method(fn_name="get", args=[])
+
+    def _preflight(self, tx_factory, block=ZkBlockParams.COMMITTED.value, address=None):
+        """
+        INFO: nonce and gas price are independent, the nonce is fetched on the worker pool
+              while gas price is read on the calling thread,
+              estimation needs the built transaction so it goes after both
+        """
+        if address is None:
+            address = self.account.address
+        nonce_future = self._executor.submit(self.zks.get_transaction_count, address, block)
+        gas_price = self.zks.gas_price
+        nonce = nonce_future.result()
+        tx = tx_factory(nonce, gas_price)
+        estimate_gas = self.zks.eth_estimate_gas(tx.tx)
+        return tx, gas_price, estimate_gas
+
+    def _gather(self, *calls):
+        futures = [self._executor.submit(fn, *args) for fn, *args in calls]
+        return [f.result() for f in futures]
+
+    def _zks_batch(self, calls):
+        responses = self.zksync_provider.make_batch_request(calls)
+        results = []
+        for (method, _), response in zip(calls, responses):
+            if "error" in response:
+                raise ValueError(response["error"])
+            formatter = ZKSYNC_RESULT_FORMATTERS.get(method)
+            result = response["result"]
+            results.append(result if formatter is None else formatter(result))
+        return results
+
+    def _erc20_balances(self, token_address, *owners):
+        """
+        INFO: all balanceOf reads go in one JSON-RPC batch instead of a call (plus chain id lookup) per owner
+        """
+        results = self._zks_batch([
+            (RPCEndpoint("eth_call"), [{"to": token_address, "data": encode_erc20_balance_of(owner)},
+                                       LATEST_BLOCK])
+            for owner in owners
+        ])
+        return [int(result, 16) for result in results]
+
+    def _reader(self):
+        return next(self._read_pool).zksync
+
+    def _wait(self, tx_hash):
+        return self.zks.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.1)
+
     @skip("Integration test, used for develop purposes only")
     def test_send_money(self):
         gas_limit = 21000
@@ -79,13 +234,13 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_l2_balance(self):
-        zk_balance = self.web3.zksync.get_balance(self.account.address, EthBlockParams.LATEST.value)
+        zk_balance = self.zks.get_balance(self.account.address, LATEST_BLOCK)
         print(f"ZkSync balance: {zk_balance}")
         print(f"In Ether: {Web3.from_wei(zk_balance, 'ether')}")
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_nonce(self):
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.LATEST.value)
+        nonce = self.zks.get_transaction_count(self.account.address, LATEST_BLOCK)
         print(f"Nonce: {nonce}")
 
     # @skip("Integration test, used for develop purposes only")
@@ -96,72 +251,65 @@ class ZkSyncWeb3Tests(TestCase):
     # @skip("Integration test, used for develop purposes only")
     def test_get_transaction_receipt(self):
         if self.test_tx_hash is None:
-            nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-            gas_price = self.web3.zksync.gas_price
-            tx_func_call = TxFunctionCall(chain_id=self.chain_id,
-                                          nonce=nonce,
-                                          from_=self.account.address,
-                                          to=self.account.address,
-                                          value=Web3.to_wei(0.01, 'ether'),
-                                          data=HexStr("0x"),
-                                          gas_limit=0,  # UNKNOWN AT THIS STATE
-                                          gas_price=gas_price,
-                                          max_priority_fee_per_gas=100000000)
-            estimate_gas = self.web3.zksync.eth_estimate_gas(tx_func_call.tx)
+            tx_func_call, gas_price, estimate_gas = self._preflight(
+                lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                        nonce=nonce,
+                                                        from_=self.account.address,
+                                                        to=self.account.address,
+                                                        value=Web3.to_wei(0.01, 'ether'),
+                                                        data=HexStr("0x"),
+                                                        gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                        gas_price=gas_price,
+                                                        max_priority_fee_per_gas=100000000))
             print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
             tx_712 = tx_func_call.tx712(estimate_gas)
             singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
             msg = tx_712.encode(singed_message)
-            self.test_tx_hash = self.web3.zksync.send_raw_transaction(msg)
-            self.web3.zksync.wait_for_transaction_receipt(self.test_tx_hash)
-        receipt = self.web3.zksync.get_transaction_receipt(self.test_tx_hash)
+            self.test_tx_hash = self.zks.send_raw_transaction(msg)
+            self._wait(self.test_tx_hash)
+        receipt = self.zks.get_transaction_receipt(self.test_tx_hash)
         print(f"receipt: {receipt['blockHash'].hex()}")
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_transaction(self):
         if self.test_tx_hash is None:
-            nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-            gas_price = self.web3.zksync.gas_price
-            tx_func_call = TxFunctionCall(chain_id=self.chain_id,
-                                          nonce=nonce,
-                                          from_=self.account.address,
-                                          to=self.account.address,
-                                          value=Web3.to_wei(0.01, 'ether'),
-                                          data=HexStr("0x"),
-                                          gas_limit=0,  # UNKNOWN AT THIS STATE
-                                          gas_price=gas_price,
-                                          max_priority_fee_per_gas=100000000)
-            estimate_gas = self.web3.zksync.eth_estimate_gas(tx_func_call.tx)
+            tx_func_call, gas_price, estimate_gas = self._preflight(
+                lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                        nonce=nonce,
+                                                        from_=self.account.address,
+                                                        to=self.account.address,
+                                                        value=Web3.to_wei(0.01, 'ether'),
+                                                        data=HexStr("0x"),
+                                                        gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                        gas_price=gas_price,
+                                                        max_priority_fee_per_gas=100000000))
             print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
             tx_712 = tx_func_call.tx712(estimate_gas)
             singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
             msg = tx_712.encode(singed_message)
-            self.test_tx_hash = self.web3.zksync.send_raw_transaction(msg)
-            self.web3.zksync.wait_for_transaction_receipt(self.test_tx_hash)
-        tx = self.web3.zksync.get_transaction(self.test_tx_hash)
+            self.test_tx_hash = self.zks.send_raw_transaction(msg)
+            self._wait(self.test_tx_hash)
+        tx = self.zks.get_transaction(self.test_tx_hash)
         self.assertEqual(tx['from'], self.account.address)
 
     # @skip("Integration test, used for develop purposes only")
     def test_estimate_gas_transfer_native(self):
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-        gas_price = self.web3.zksync.gas_price
-        func_call = TxFunctionCall(chain_id=self.chain_id,
-                                   nonce=nonce,
-                                   from_=self.account.address,
-                                   to=self.account.address,
-                                   gas_limit=0,
-                                   gas_price=gas_price)
-
-        estimate_gas = self.web3.zksync.eth_estimate_gas(func_call.tx)
+        _, _, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=self.account.address,
+                                                    to=self.account.address,
+                                                    gas_limit=0,
+                                                    gas_price=gas_price))
         print(f"test_estimate_gas_transfer_native, estimate_gas: {estimate_gas}")
         self.assertGreater(estimate_gas, 0, "test_estimate_gas_transfer_native, estimate_gas must be greater 0")
 
     # @skip("Integration test, used for develop purposes only")
     def test_estimate_fee_transfer_native(self):
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-        gas_price = self.web3.zksync.gas_price
+        nonce = self.zks.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
+        gas_price = self.zks.gas_price
 
         func_call = TxFunctionCall(chain_id=self.chain_id,
                                    nonce=nonce,
@@ -169,52 +317,48 @@ class ZkSyncWeb3Tests(TestCase):
                                    to=self.account.address,
                                    gas_limit=0,
                                    gas_price=gas_price)
-        estimated_fee = self.web3.zksync.zks_estimate_fee(func_call.tx)
+        estimated_fee = self.zks.zks_estimate_fee(func_call.tx)
         print(f"Estimated fee: {estimated_fee}")
 
     # @skip("Integration test, used for develop purposes only")
     def test_transfer_native_to_self(self):
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-        gas_price = self.web3.zksync.gas_price
-        tx_func_call = TxFunctionCall(chain_id=self.chain_id,
-                                      nonce=nonce,
-                                      from_=self.account.address,
-                                      to=self.account.address,
-                                      value=Web3.to_wei(0.01, 'ether'),
-                                      data=HexStr("0x"),
-                                      gas_limit=0,  # UNKNOWN AT THIS STATE
-                                      gas_price=gas_price,
-                                      max_priority_fee_per_gas=100000000)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(tx_func_call.tx)
+        tx_func_call, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=self.account.address,
+                                                    to=self.account.address,
+                                                    value=Web3.to_wei(0.01, 'ether'),
+                                                    data=HexStr("0x"),
+                                                    gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                    gas_price=gas_price,
+                                                    max_priority_fee_per_gas=100000000))
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
         tx_712 = tx_func_call.tx712(estimate_gas)
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
 
     def deploy_erc20_token_builder(self):
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-        counter_contract = ContractEncoder.from_json(self.web3, contract_path("SomeERC20.json"))
-        random_salt = generate_random_salt()
-        gas_price = self.web3.zksync.gas_price
-        create_contract = TxCreateContract(web3=self.web3,
-                                           chain_id=self.chain_id,
-                                           nonce=nonce,
-                                           from_=self.account.address,
-                                           gas_limit=0,  # UNKNOWN AT THIS STATE
-                                           gas_price=gas_price,
-                                           bytecode=counter_contract.bytecode,
-                                           salt=random_salt)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create_contract.tx)
+        counter_contract = self._load("SomeERC20.json")
+        random_salt = generate_random_salt(self.id().encode())
+        create_contract, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreateContract(web3=self.web3,
+                                                      chain_id=self.chain_id,
+                                                      nonce=nonce,
+                                                      from_=self.account.address,
+                                                      gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                      gas_price=gas_price,
+                                                      bytecode=counter_contract.bytecode,
+                                                      salt=random_salt))
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
         tx_712 = create_contract.tx712(estimate_gas)
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt['status'])
         contract_address = tx_receipt["contractAddress"]
         if self.some_erc20_address is None:
@@ -222,64 +366,57 @@ class ZkSyncWeb3Tests(TestCase):
         print(f"Contract: {contract_address}")
 
     def mint_some_erc20(self, amount: int):
-        some_erc20_encoder = ContractEncoder.from_json(self.web3, contract_path("SomeERC20.json"))
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.LATEST.value)
-        gas_price = self.web3.zksync.gas_price
-
+        some_erc20_encoder = self._load("SomeERC20.json")
         args = (self.account.address, self.ERC20_Token.to_int(amount))
         call_data = some_erc20_encoder.encode_method(fn_name='mint', args=args)
-        func_call = TxFunctionCall(chain_id=self.chain_id,
-                                   nonce=nonce,
-                                   from_=self.account.address,
-                                   to=self.some_erc20_address,
-                                   data=call_data,
-                                   gas_limit=0,  # UNKNOWN AT THIS STATE,
-                                   gas_price=gas_price)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(func_call.tx)
+        func_call, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=self.account.address,
+                                                    to=self.some_erc20_address,
+                                                    data=call_data,
+                                                    gas_limit=0,  # UNKNOWN AT THIS STATE,
+                                                    gas_price=gas_price),
+            block=LATEST_BLOCK)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
         tx_712 = func_call.tx712(estimate_gas)
 
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt['status'])
         print(f"Mint tx status: {tx_receipt['status']}")
 
     # @skip("Integration test, used for develop purposes only")
     def test_transfer_erc20_token_to_self(self):
-        erc20 = ERC20Contract(web3=self.web3.zksync,
+        erc20 = ERC20Contract(web3=self.zks,
                               contract_address=self.some_erc20_address,
                               account=self.account)
         balance_before = erc20.balance_of(self.account.address)
         print(f"{self.ERC20_Token.symbol} balance before : {self.ERC20_Token.format_token(balance_before)}")
 
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
         token_address = self.ERC20_Token.l2_address
 
         tokens_amount = 1
-        erc20_encoder = ERC20Encoder(self.web3)
-        transfer_params = (self.account.address, self.ERC20_Token.to_int(tokens_amount))
-        call_data = erc20_encoder.encode_method("transfer", args=transfer_params)
-
-        gas_price = self.web3.zksync.gas_price
-        func_call = TxFunctionCall(chain_id=self.chain_id,
-                                   nonce=nonce,
-                                   from_=self.account.address,
-                                   to=token_address,
-                                   data=call_data,
-                                   gas_limit=0,  # UNKNOWN AT THIS STATE
-                                   gas_price=gas_price,
-                                   max_priority_fee_per_gas=100000000)
-
-        estimate_gas = self.web3.zksync.eth_estimate_gas(func_call.tx)
+        call_data = encode_erc20_transfer(self.account.address, self.ERC20_Token.to_int(tokens_amount))
+
+        func_call, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=self.account.address,
+                                                    to=token_address,
+                                                    data=call_data,
+                                                    gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                    gas_price=gas_price,
+                                                    max_priority_fee_per_gas=100000000))
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
         tx_712 = func_call.tx712(estimated_gas=estimate_gas)
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
 
         balance_after = erc20.balance_of(self.account.address)
@@ -291,44 +428,37 @@ class ZkSyncWeb3Tests(TestCase):
         alice = self.account
         bob: LocalAccount = Account.from_key(env_bob.key)
 
-        erc20 = ERC20Contract(web3=self.web3.zksync,
-                              contract_address=self.some_erc20_address,
-                              account=alice)
-        alice_balance_before = erc20.balance_of(alice.address)
-        bob_balance_before = erc20.balance_of(bob.address)
+        alice_balance_before, bob_balance_before = self._erc20_balances(self.some_erc20_address,
+                                                                        alice.address, bob.address)
         print(f"Alice {self.ERC20_Token.symbol} balance before : {self.ERC20_Token.format_token(alice_balance_before)}")
         print(f"Bob {self.ERC20_Token.symbol} balance before : {self.ERC20_Token.format_token(bob_balance_before)}")
 
-        nonce = self.web3.zksync.get_transaction_count(alice.address, ZkBlockParams.COMMITTED.value)
         token_address = self.ERC20_Token.l2_address
 
         tokens_amount = 1
-        erc20_encoder = ERC20Encoder(self.web3)
-        transfer_params = (bob.address, self.ERC20_Token.to_int(tokens_amount))
-        call_data = erc20_encoder.encode_method("transfer", args=transfer_params)
-
-        gas_price = self.web3.zksync.gas_price
-        func_call = TxFunctionCall(chain_id=self.chain_id,
-                                   nonce=nonce,
-                                   from_=alice.address,
-                                   to=token_address,
-                                   data=call_data,
-                                   gas_limit=0,  # UNKNOWN AT THIS STATE
-                                   gas_price=gas_price,
-                                   max_priority_fee_per_gas=100000000)
-
-        estimate_gas = self.web3.zksync.eth_estimate_gas(func_call.tx)
+        call_data = encode_erc20_transfer(bob.address, self.ERC20_Token.to_int(tokens_amount))
+
+        func_call, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=alice.address,
+                                                    to=token_address,
+                                                    data=call_data,
+                                                    gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                    gas_price=gas_price,
+                                                    max_priority_fee_per_gas=100000000),
+            address=alice.address)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
         tx_712 = func_call.tx712(estimated_gas=estimate_gas)
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
         print(f"Tx hash: {tx_receipt['transactionHash'].hex()}")
 
-        alice_balance_after = erc20.balance_of(alice.address)
-        bob_balance_after = erc20.balance_of(bob.address)
+        alice_balance_after, bob_balance_after = self._erc20_balances(self.some_erc20_address,
+                                                                      alice.address, bob.address)
         print(f"Alice {self.ERC20_Token.symbol} balance before : {self.ERC20_Token.format_token(alice_balance_after)}")
         print(f"Bob {self.ERC20_Token.symbol} balance before : {self.ERC20_Token.format_token(bob_balance_after)}")
 
@@ -342,7 +472,7 @@ class ZkSyncWeb3Tests(TestCase):
                               amount=1,
                               gas_limit=0,  # unknown
                               account=self.account)
-        estimated_gas = self.web3.zksync.eth_estimate_gas(withdraw.tx)
+        estimated_gas = self.zks.eth_estimate_gas(withdraw.tx)
         print(f"test_estimate_gas_withdraw, estimate_gas {estimated_gas}")
         self.assertGreater(estimated_gas, 0, "test_estimate_gas_withdraw, estimate_gas must be greater 0")
 
@@ -364,11 +494,11 @@ class ZkSyncWeb3Tests(TestCase):
                               amount=Web3.to_wei(amount, "ether"),
                               gas_limit=0,  # unknown
                               account=self.account)
-        estimated_gas = self.web3.zksync.eth_estimate_gas(withdraw.tx)
+        estimated_gas = self.zks.eth_estimate_gas(withdraw.tx)
         tx = withdraw.estimated_gas(estimated_gas)
         signed = self.account.sign_transaction(tx)
-        tx_hash = self.web3.zksync.send_raw_transaction(signed.rawTransaction)
-        zks_receipt = self.web3.zksync.wait_finalized(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(signed.rawTransaction)
+        zks_receipt = self.zks.wait_finalized(tx_hash, timeout=240, poll_latency=0.5)
         self.assertEqual(1, zks_receipt['status'])
 
         tx_receipt = eth_provider.finalize_withdrawal(zks_receipt["transactionHash"])
@@ -387,77 +517,67 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_estimate_gas_execute(self):
-        erc20func_encoder = ERC20Encoder(self.web3)
-        transfer_args = (
-            Web3.to_checksum_address("0xe1fab3efd74a77c23b426c302d96372140ff7d0c"),
-            1
-        )
-        call_data = erc20func_encoder.encode_method(fn_name="transfer", args=transfer_args)
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, ZkBlockParams.COMMITTED.value)
-        gas_price = self.web3.zksync.gas_price
+        call_data = encode_erc20_transfer(Web3.to_checksum_address("0xe1fab3efd74a77c23b426c302d96372140ff7d0c"), 1)
 
-        call_data_bytes = to_bytes(call_data)
-        print(f"Call data length: {len(call_data_bytes)}")
+        print(f"Call data length: {(len(call_data) - 2) >> 1}")
 
         to_addr = Web3.to_checksum_address("0x79f73588fa338e685e9bbd7181b410f60895d2a3")
-        func_call = TxFunctionCall(chain_id=self.chain_id,
-                                   nonce=nonce,
-                                   from_=self.account.address,
-                                   to=to_addr,
-                                   data=HexStr(call_data),
-                                   gas_limit=0,
-                                   gas_price=gas_price)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(func_call.tx)
+        _, _, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=self.account.address,
+                                                    to=to_addr,
+                                                    data=HexStr(call_data),
+                                                    gas_limit=0,
+                                                    gas_price=gas_price))
         print(f"test_estimate_gas_execute, estimate_gas: {estimate_gas}")
         self.assertGreater(estimate_gas, 0, "test_estimate_withdraw, estimate_gas must be greater 0")
 
     # @skip("Integration test, used for develop purposes only")
     def test_estimate_gas_deploy_contract(self):
-        counter_contract = ContractEncoder.from_json(self.web3, contract_path("Counter.json"))
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-        gas_price = self.web3.zksync.gas_price
-        create2_contract = TxCreate2Contract(web3=self.web3,
-                                             chain_id=self.chain_id,
-                                             nonce=nonce,
-                                             from_=self.account.address,
-                                             gas_limit=0,
-                                             gas_price=gas_price,
-                                             bytecode=counter_contract.bytecode)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create2_contract.tx)
+        counter_contract = self._load("Counter.json")
+        _, _, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreate2Contract(web3=self.web3,
+                                                       chain_id=self.chain_id,
+                                                       nonce=nonce,
+                                                       from_=self.account.address,
+                                                       gas_limit=0,
+                                                       gas_price=gas_price,
+                                                       bytecode=counter_contract.bytecode),
+            block=EthBlockParams.PENDING.value)
         print(f"test_estimate_gas_deploy_contract, estimate_gas: {estimate_gas}")
         self.assertGreater(estimate_gas, 0, "test_estimate_gas_deploy_contract, estimate_gas must be greater 0")
 
     # @skip("Integration test, used for develop purposes only")
     def test_deploy_contract_create(self):
-        random_salt = generate_random_salt()
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
+        random_salt = generate_random_salt(self.id().encode())
         nonce_holder = NonceHolder(self.web3, self.account)
         deployment_nonce = nonce_holder.get_deployment_nonce(self.account.address)
         deployer = PrecomputeContractDeployer(self.web3)
         precomputed_address = deployer.compute_l2_create_address(self.account.address, deployment_nonce)
-        counter_contract = ContractEncoder.from_json(self.web3, contract_path("Counter.json"))
+        counter_contract = self._load("Counter.json")
 
         print(f"precomputed address: {precomputed_address}")
 
-        gas_price = self.web3.zksync.gas_price
-        create_contract = TxCreateContract(web3=self.web3,
-                                           chain_id=self.chain_id,
-                                           nonce=nonce,
-                                           from_=self.account.address,
-                                           gas_limit=0,  # UNKNOWN AT THIS STATE
-                                           gas_price=gas_price,
-                                           bytecode=counter_contract.bytecode,
-                                           salt=random_salt)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create_contract.tx)
+        create_contract, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreateContract(web3=self.web3,
+                                                      chain_id=self.chain_id,
+                                                      nonce=nonce,
+                                                      from_=self.account.address,
+                                                      gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                      gas_price=gas_price,
+                                                      bytecode=counter_contract.bytecode,
+                                                      salt=random_salt),
+            block=EthBlockParams.PENDING.value)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
         tx_712 = create_contract.tx712(estimate_gas)
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
         contract_address = tx_receipt["contractAddress"]
-        self.counter_address = contract_address
+        type(self).counter_address = contract_address
 
         print(f"contract address: {contract_address}")
         self.assertEqual(precomputed_address.lower(), contract_address.lower())
@@ -472,15 +592,13 @@ class ZkSyncWeb3Tests(TestCase):
 
     @skip("web3py 6.0.0 does not provide protocol version")
     def test_protocol_version(self):
-        version = self.web3.zksync.protocol_version
+        version = self.zks.protocol_version
         print(f"Protocol version: {version}")
         self.assertEqual(version, "zks/1")
 
     # @skip("Integration test, used for develop purposes only")
     def test_deploy_contract_with_constructor_create(self):
-        random_salt = generate_random_salt()
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-        gas_price = self.web3.zksync.gas_price
+        random_salt = generate_random_salt(self.id().encode())
 
         nonce_holder = NonceHolder(self.web3, self.account)
         deployment_nonce = nonce_holder.get_deployment_nonce(self.account.address)
@@ -488,22 +606,22 @@ class ZkSyncWeb3Tests(TestCase):
         deployer = PrecomputeContractDeployer(self.web3)
         precomputed_address = deployer.compute_l2_create_address(self.account.address, deployment_nonce)
 
-        constructor_encoder = ContractEncoder.from_json(self.web3, contract_path("SimpleConstructor.json"))
+        constructor_encoder = self._load("SimpleConstructor.json")
         a = 2
         b = 3
         encoded_ctor = constructor_encoder.encode_constructor(a=a, b=b, shouldRevert=False)
 
-        create_contract = TxCreateContract(web3=self.web3,
-                                           chain_id=self.chain_id,
-                                           nonce=nonce,
-                                           from_=self.account.address,
-                                           gas_limit=0,  # UNKNOWN AT THIS STATE,
-                                           gas_price=gas_price,
-                                           bytecode=constructor_encoder.bytecode,
-                                           call_data=encoded_ctor
-                                           , salt=random_salt)
-
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create_contract.tx)
+        create_contract, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreateContract(web3=self.web3,
+                                                      chain_id=self.chain_id,
+                                                      nonce=nonce,
+                                                      from_=self.account.address,
+                                                      gas_limit=0,  # UNKNOWN AT THIS STATE,
+                                                      gas_price=gas_price,
+                                                      bytecode=constructor_encoder.bytecode,
+                                                      call_data=encoded_ctor,
+                                                      salt=random_salt),
+            block=EthBlockParams.PENDING.value)
 
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
@@ -511,8 +629,8 @@ class ZkSyncWeb3Tests(TestCase):
 
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
 
         contract_address = tx_receipt["contractAddress"]
@@ -530,37 +648,38 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_deploy_contract_create2(self):
-        random_salt = generate_random_salt()
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-        gas_price = self.web3.zksync.gas_price
+        random_salt = generate_random_salt(self.id().encode())
         deployer = PrecomputeContractDeployer(self.web3)
 
-        counter_contract_encoder = ContractEncoder.from_json(self.web3, contract_path("Counter.json"))
+        counter_contract_encoder = self._load("Counter.json")
+        bytecode_hash = hash_byte_code(counter_contract_encoder.bytecode)
         precomputed_address = deployer.compute_l2_create2_address(sender=self.account.address,
-                                                                  bytecode=counter_contract_encoder.bytecode,
                                                                   constructor=b'',
-                                                                  salt=random_salt)
-        create2_contract = TxCreate2Contract(web3=self.web3,
-                                             chain_id=self.chain_id,
-                                             nonce=nonce,
-                                             from_=self.account.address,
-                                             gas_limit=0,
-                                             gas_price=gas_price,
-                                             bytecode=counter_contract_encoder.bytecode,
-                                             salt=random_salt)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create2_contract.tx)
+                                                                  salt=random_salt,
+                                                                  bytecode_hash=bytecode_hash)
+        create2_contract, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreate2Contract(web3=self.web3,
+                                                       chain_id=self.chain_id,
+                                                       nonce=nonce,
+                                                       from_=self.account.address,
+                                                       gas_limit=0,
+                                                       gas_price=gas_price,
+                                                       bytecode=counter_contract_encoder.bytecode,
+                                                       salt=random_salt,
+                                                       bytecode_hash=bytecode_hash),
+            block=EthBlockParams.PENDING.value)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
         tx_712 = create2_contract.tx712(estimate_gas)
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=1.0)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
 
         self.assertEqual(1, tx_receipt["status"])
 
         contract_address = tx_receipt["contractAddress"]
-        self.counter_address = contract_address
+        type(self).counter_address = contract_address
 
         print(f"contract address: {contract_address}")
         self.assertEqual(precomputed_address.lower(), contract_address.lower())
@@ -575,36 +694,34 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_deploy_contract_with_deps_create(self):
-        random_salt = generate_random_salt()
-        import_contract = ContractEncoder.from_json(self.web3, contract_path("Import.json"))
-        import_dependency_contract = ContractEncoder.from_json(self.web3, contract_path("Foo.json"))
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-        gas_price = self.web3.zksync.gas_price
+        random_salt = generate_random_salt(self.id().encode())
+        import_contract = self._load("Import.json")
+        import_dependency_contract = self._load("Foo.json")
         nonce_holder = NonceHolder(self.web3, self.account)
         deployment_nonce = nonce_holder.get_deployment_nonce(self.account.address)
         contract_deployer = PrecomputeContractDeployer(self.web3)
         precomputed_address = contract_deployer.compute_l2_create_address(self.account.address,
                                                                           deployment_nonce)
 
-        create_contract = TxCreateContract(web3=self.web3,
-                                           chain_id=self.chain_id,
-                                           nonce=nonce,
-                                           from_=self.account.address,
-                                           gas_limit=0,
-                                           gas_price=gas_price,
-                                           bytecode=import_contract.bytecode,
-                                           deps=[import_dependency_contract.bytecode],
-                                           salt=random_salt)
-
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create_contract.tx)
+        create_contract, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreateContract(web3=self.web3,
+                                                      chain_id=self.chain_id,
+                                                      nonce=nonce,
+                                                      from_=self.account.address,
+                                                      gas_limit=0,
+                                                      gas_price=gas_price,
+                                                      bytecode=import_contract.bytecode,
+                                                      deps=[import_dependency_contract.bytecode],
+                                                      salt=random_salt),
+            block=EthBlockParams.PENDING.value)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
         tx_712 = create_contract.tx712(estimate_gas)
 
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
 
         contract_address = contract_deployer.extract_contract_address(tx_receipt)
@@ -613,35 +730,36 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_deploy_contract_with_deps_create2(self):
-        random_salt = generate_random_salt()
-        import_contract = ContractEncoder.from_json(self.web3, contract_path("Import.json"))
-        import_dependency_contract = ContractEncoder.from_json(self.web3, contract_path("Foo.json"))
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-        gas_price = self.web3.zksync.gas_price
+        random_salt = generate_random_salt(self.id().encode())
+        import_contract = self._load("Import.json")
+        import_dependency_contract = self._load("Foo.json")
 
         contract_deployer = PrecomputeContractDeployer(self.web3)
+        bytecode_hash = hash_byte_code(import_contract.bytecode)
         precomputed_address = contract_deployer.compute_l2_create2_address(self.account.address,
-                                                                           bytecode=import_contract.bytecode,
                                                                            constructor=b'',
-                                                                           salt=random_salt)
-        create2_contract = TxCreate2Contract(web3=self.web3,
-                                             chain_id=self.chain_id,
-                                             nonce=nonce,
-                                             from_=self.account.address,
-                                             gas_limit=0,
-                                             gas_price=gas_price,
-                                             bytecode=import_contract.bytecode,
-                                             deps=[import_dependency_contract.bytecode],
-                                             salt=random_salt)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(create2_contract.tx)
+                                                                           salt=random_salt,
+                                                                           bytecode_hash=bytecode_hash)
+        create2_contract, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxCreate2Contract(web3=self.web3,
+                                                       chain_id=self.chain_id,
+                                                       nonce=nonce,
+                                                       from_=self.account.address,
+                                                       gas_limit=0,
+                                                       gas_price=gas_price,
+                                                       bytecode=import_contract.bytecode,
+                                                       deps=[import_dependency_contract.bytecode],
+                                                       salt=random_salt,
+                                                       bytecode_hash=bytecode_hash),
+            block=EthBlockParams.PENDING.value)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
         tx_712 = create2_contract.tx712(estimate_gas)
 
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
         contract_address = contract_deployer.extract_contract_address(tx_receipt)
         print(f"contract address: {contract_address}")
@@ -649,67 +767,66 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_execute_contract(self):
-        counter_contract = ContractEncoder.from_json(self.web3, contract_path("Counter.json"))
+        counter_contract = self._load("Counter.json")
         if self.counter_address is None:
-            random_salt = generate_random_salt()
-            nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-            gas_price = self.web3.zksync.gas_price
-            create_contract = TxCreateContract(web3=self.web3,
-                                               chain_id=self.chain_id,
-                                               nonce=nonce,
-                                               from_=self.account.address,
-                                               gas_limit=0,  # UNKNOWN AT THIS STATE
-                                               gas_price=gas_price,
-                                               bytecode=counter_contract.bytecode,
-                                               salt=random_salt)
-            estimate_gas = self.web3.zksync.eth_estimate_gas(create_contract.tx)
+            random_salt = generate_random_salt(self.id().encode())
+            create_contract, gas_price, estimate_gas = self._preflight(
+                lambda nonce, gas_price: TxCreateContract(web3=self.web3,
+                                                          chain_id=self.chain_id,
+                                                          nonce=nonce,
+                                                          from_=self.account.address,
+                                                          gas_limit=0,  # UNKNOWN AT THIS STATE
+                                                          gas_price=gas_price,
+                                                          bytecode=counter_contract.bytecode,
+                                                          salt=random_salt),
+                block=EthBlockParams.PENDING.value)
             print(f"Fee for transaction is: {estimate_gas * gas_price}")
             tx_712 = create_contract.tx712(estimate_gas)
             singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
             msg = tx_712.encode(singed_message)
-            tx_hash = self.web3.zksync.send_raw_transaction(msg)
-            tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+            tx_hash = self.zks.send_raw_transaction(msg)
+            tx_receipt = self._wait(tx_hash)
             self.assertEqual(1, tx_receipt["status"])
             contract_address = tx_receipt["contractAddress"]
-            self.counter_address = contract_address
+            type(self).counter_address = contract_address
 
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.LATEST.value)
-        encoded_get = counter_contract.encode_method(fn_name="get", args=[])
+        call = self.zks.call
         eth_tx: TxParams = {
             "from": self.account.address,
             "to": self.counter_address,
-            "data": encoded_get,
+            "data": self._counter_get_data(),
         }
-        eth_ret = self.web3.zksync.call(eth_tx, EthBlockParams.LATEST.value)
-        result = int.from_bytes(eth_ret, "big", signed=True)
-        gas_price = self.web3.zksync.gas_price
+        eth_ret = call(eth_tx, LATEST_BLOCK)
+        result = decode_int256(eth_ret)
 
         call_data = counter_contract.encode_method(fn_name="increment", args=[1])
-        func_call = TxFunctionCall(chain_id=self.chain_id,
-                                   nonce=nonce,
-                                   from_=self.account.address,
-                                   to=self.counter_address,
-                                   data=call_data,
-                                   gas_limit=0,  # UNKNOWN AT THIS STATE,
-                                   gas_price=gas_price)
-        estimate_gas = self.web3.zksync.eth_estimate_gas(func_call.tx)
+        func_call, gas_price, estimate_gas = self._preflight(
+            lambda nonce, gas_price: TxFunctionCall(chain_id=self.chain_id,
+                                                    nonce=nonce,
+                                                    from_=self.account.address,
+                                                    to=self.counter_address,
+                                                    data=call_data,
+                                                    gas_limit=0,  # UNKNOWN AT THIS STATE,
+                                                    gas_price=gas_price),
+            block=LATEST_BLOCK)
         print(f"Fee for transaction is: {estimate_gas * gas_price}")
 
         tx_712 = func_call.tx712(estimate_gas)
 
         singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
         msg = tx_712.encode(singed_message)
-        tx_hash = self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        tx_hash = self.zks.send_raw_transaction(msg)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt["status"])
 
-        eth_ret2 = self.web3.zksync.call(eth_tx, EthBlockParams.LATEST.value)
-        updated_result = int.from_bytes(eth_ret2, "big", signed=True)
-        self.assertEqual(result + 1, updated_result)
+        # INFO: read state at the block that included increment, not whatever "latest" resolves to
+        eth_ret2 = call(eth_tx, tx_receipt["blockNumber"])
+        updated_result = decode_int256(eth_ret2)
+        self.assertEqual(1, updated_result - result)
 
     def test_contract_factory(self):
         increment_value = 10
-        salt = generate_random_salt()
+        salt = generate_random_salt(self.id().encode())
         deployer = LegacyContractFactory.from_json(zksync=self.web3,
                                                    compiled_contract=contract_path("Counter.json"),
                                                    account=self.account,
@@ -720,8 +837,8 @@ class ZkSyncWeb3Tests(TestCase):
         })
         print(f"Value: {value}")
 
-        gas_price = self.web3.zksync.gas_price
-        nonce = self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.LATEST.value)
+        gas_price = self.zks.gas_price
+        nonce = self.zks.get_transaction_count(self.account.address, LATEST_BLOCK)
         tx = contract.functions.increment(increment_value).build_transaction({
             "nonce": nonce,
             "from": self.account.address,
@@ -731,8 +848,8 @@ class ZkSyncWeb3Tests(TestCase):
             "maxFeePerGas": gas_price
         })
         signed = self.account.sign_transaction(tx)
-        tx_hash = self.web3.zksync.send_raw_transaction(signed.rawTransaction)
-        tx_receipt = self.web3.zksync.wait_for_transaction_receipt(tx_hash)
+        tx_hash = self.zks.send_raw_transaction(signed.rawTransaction)
+        tx_receipt = self._wait(tx_hash)
         self.assertEqual(1, tx_receipt['status'])
 
         value = contract.functions.get().call(
@@ -744,34 +861,71 @@ class ZkSyncWeb3Tests(TestCase):
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_all_account_balances(self):
-        balances = self.web3.zksync.zks_get_all_account_balances(self.account.address)
-        print(f"balances : {balances}")
+        balances = self._reader().zks_get_all_account_balances(self.account.address)
+        _dump("balances", balances)
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_confirmed_tokens(self):
-        confirmed = self.web3.zksync.zks_get_confirmed_tokens(0, 100)
-        print(f"confirmed tokens: {confirmed}")
+        confirmed = self.zks.zks_get_confirmed_tokens(0, 100)
+        _dump("confirmed tokens", confirmed)
         for token in confirmed:
             if token.is_eth():
-                balance = self.web3.zksync.get_balance(self.account.address)
+                balance = self.zks.get_balance(self.account.address)
             else:
-                erc20 = ERC20Contract(web3=self.web3.zksync,
+                erc20 = ERC20Contract(web3=self.zks,
                                       contract_address=token.l2_address,
                                       account=self.account)
                 balance = erc20.balance_of(self.account.address)
-            print(f"Token {token.symbol} : {balance}")
+            logger.debug("Token %s : %s", token.symbol, balance)
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_token_price(self):
-        price = self.web3.zksync.zks_get_token_price(self.ETH_TOKEN.l2_address)
-        print(f"price: {price}")
+        price = self.zks.zks_get_token_price(self.ETH_TOKEN.l2_address)
+        _dump("price", price)
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_l1_chain_id(self):
-        l1_chain_id = self.web3.zksync.zks_l1_chain_id()
-        print(f"L1 chain ID: {l1_chain_id} ")
+        l1_chain_id = self.zks.zks_l1_chain_id()
+        _dump("L1 chain ID", l1_chain_id)
 
     # @skip("Integration test, used for develop purposes only")
     def test_get_bridge_addresses(self):
-        addresses = self.web3.zksync.zks_get_bridge_contracts()
-        print(f"Bridge addresses: {addresses}")
+        addresses = self.zks.zks_get_bridge_contracts()
+        _dump("Bridge addresses", addresses)
+
+    # @skip("Integration test, used for develop purposes only")
+    def test_zks_batch(self):
+        balances, confirmed, price, l1_chain_id, addresses = self._zks_batch([
+            (zks_get_all_account_balances_rpc, [self.account.address]),
+            (zks_get_confirmed_tokens_rpc, [0, 10]),
+            (zks_get_token_price_rpc, [self.ETH_TOKEN.l2_address]),
+            (zks_l1_chain_id_rpc, []),
+            (zks_get_bridge_contracts_rpc, [])
+        ])
+        _dump("balances", balances)
+        _dump("confirmed tokens", confirmed)
+        _dump("price", price)
+        _dump("L1 chain ID", l1_chain_id)
+        _dump("Bridge addresses", addresses)
+        self.assertEqual(self.zks.zks_get_confirmed_tokens(0, 10), confirmed)
+        self.assertEqual(self.zks.zks_l1_chain_id(), l1_chain_id)
+        self.assertEqual(self.zks.zks_get_bridge_contracts(), addresses)
+
+    # @skip("Integration test, used for develop purposes only")
+    def test_zks_concurrent(self):
+        balances, confirmed, price, l1_chain_id, addresses = self._gather(
+            (self._reader().zks_get_all_account_balances, self.account.address),
+            (self.zks.zks_get_confirmed_tokens, 0, 10),
+            (self.zks.zks_get_token_price, self.ETH_TOKEN.l2_address),
+            (self.zks.zks_l1_chain_id,),
+            (self.zks.zks_get_bridge_contracts,)
+        )
+        _dump("balances", balances)
+        _dump("confirmed tokens", confirmed)
+        _dump("price", price)
+        _dump("L1 chain ID", l1_chain_id)
+        _dump("Bridge addresses", addresses)
+        self.assertEqual(self.zks.zks_get_all_account_balances(self.account.address), balances)
+        self.assertEqual(self.zks.zks_get_confirmed_tokens(0, 10), confirmed)
+        self.assertEqual(self.zks.zks_l1_chain_id(), l1_chain_id)
+        self.assertEqual(self.zks.zks_get_bridge_contracts(), addresses)
@@ -7,7 +7,7 @@ from test_config import LOCAL_ENV
 from zksync2.core.utils import hash_byte_code
 from tests.contracts.utils import contract_path
 from zksync2.manage_contracts.precompute_contract_deployer import PrecomputeContractDeployer
-from zksync2.manage_contracts.contract_encoder_base import ContractEncoder
+from zksync2.manage_contracts.contract_encoder_base import ContractEncoder, JsonConfiguration
 from zksync2.module.module_builder import ZkSyncBuilder
 
 
@@ -17,7 +17,8 @@ class ContractDeployerTests(TestCase):
         env = LOCAL_ENV
         self.web3 = ZkSyncBuilder.build(env.zksync_server)
         self.contract_deployer = PrecomputeContractDeployer(self.web3)
-        counter_contract = ContractEncoder.from_json(self.web3, contract_path("Counter.json"))
+        counter_contract = ContractEncoder.from_json(self.web3, contract_path("Counter.json"),
+                                                     JsonConfiguration.STANDARD)
         self.counter_contract_bin = counter_contract.bytecode
 
     def test_compute_l2_create2(self):
@@ -27,6 +28,21 @@ class ContractDeployerTests(TestCase):
         addr = self.contract_deployer.compute_l2_create2_address(sender, self.counter_contract_bin, b'', salt)
         self.assertEqual(expected, addr)
 
+    def test_compute_l2_create2_with_bytecode_hash(self):
+        expected = Web3.to_checksum_address("0xf7671F9178dF17CF2F94a51d5a97bF54f6dff25a")
+        sender = HexStr("0xa909312acfc0ed4370b8bd20dfe41c8ff6595194")
+        salt = b'\0' * 32
+        bytecode_hash = hash_byte_code(self.counter_contract_bin)
+        addr = self.contract_deployer.compute_l2_create2_address(sender, salt=salt, bytecode_hash=bytecode_hash)
+        self.assertEqual(expected, addr)
+
+    def test_compute_l2_create2_without_bytecode(self):
+        sender = HexStr("0xa909312acfc0ed4370b8bd20dfe41c8ff6595194")
+        with self.assertRaises(ValueError):
+            self.contract_deployer.compute_l2_create2_address(sender, salt=b'\0' * 32)
+        with self.assertRaises(ValueError):
+            self.contract_deployer.encode_create2(salt=b'\0' * 32)
+
     def test_compute_l2_create(self):
         expected = Web3.to_checksum_address("0x5107b7154dfc1d3b7f1c4e19b5087e1d3393bcf4")
         sender = HexStr("0x7e5f4552091a69125d5dfcb7b8c2659029395bdf")
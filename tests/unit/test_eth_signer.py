@@ -3,6 +3,7 @@ from eth_typing import HexStr
 from zksync2.signer.eth_signer import PrivateKeyEthSigner
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
+from eth_account.messages import encode_defunct
 from eip712_structs import make_domain, EIP712Struct, String, Address
 from eth_utils.crypto import keccak_256
 
@@ -53,3 +54,24 @@ class EthSignerTests(TestCase):
     def test_verify_signed_typed_data(self):
         ret = self.signer.verify_typed_data(self._TEST_TYPED_EXPECTED_SIGNATURE, self.mail, self.domain)
         self.assertTrue(ret)
+
+    def test_default_domain_signed_bytes(self):
+        expected = encode_defunct(self.mail.signable_bytes(self.signer.domain))
+        self.assertEqual(expected, self.signer.typed_data_to_signed_bytes(self.mail))
+
+    def test_reassigned_default_domain_signed_bytes(self):
+        self.signer.default_domain = self.domain
+        expected = encode_defunct(self.mail.signable_bytes(self.domain))
+        self.assertEqual(expected, self.signer.typed_data_to_signed_bytes(self.mail))
+
+    def test_overridden_domain_signed_bytes(self):
+        domain = self.domain
+
+        class CustomDomainSigner(PrivateKeyEthSigner):
+            @property
+            def domain(self):
+                return domain
+
+        signer = CustomDomainSigner(self.account, 1)
+        expected = encode_defunct(self.mail.signable_bytes(self.domain))
+        self.assertEqual(expected, signer.typed_data_to_signed_bytes(self.mail))
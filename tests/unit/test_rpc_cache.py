@@ -0,0 +1,54 @@
+import sqlite3
+from unittest import TestCase
+from tests.integration.rpc_cache import build_rpc_cache_middleware
+
+SCOPE = ("http://127.0.0.1:3050", 270, "0x" + "ab" * 32)
+
+
+class RpcCacheMiddlewareTests(TestCase):
+
+    def setUp(self) -> None:
+        self.db = sqlite3.connect(":memory:")
+        self.calls = []
+        self.response = {"jsonrpc": "2.0", "id": 0, "result": "0x9"}
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        return self.response
+
+    def build(self, scope=SCOPE, ttl=None):
+        return build_rpc_cache_middleware(self.db, scope, ttl)(self.make_request, None)
+
+    def test_hit(self):
+        middleware = self.build()
+        self.assertEqual(self.response, middleware("zks_L1ChainId", []))
+        self.assertEqual(self.response, middleware("zks_L1ChainId", []))
+        self.assertEqual(["zks_L1ChainId"], self.calls)
+
+    def test_not_cacheable(self):
+        middleware = self.build()
+        middleware("eth_chainId", [])
+        middleware("eth_chainId", [])
+        self.assertEqual(["eth_chainId", "eth_chainId"], self.calls)
+
+    def test_expired(self):
+        middleware = self.build(ttl={"zks_getBridgeContracts": -1})
+        middleware("zks_getBridgeContracts", [])
+        middleware("zks_getBridgeContracts", [])
+        self.assertEqual(["zks_getBridgeContracts", "zks_getBridgeContracts"], self.calls)
+
+    def test_error_not_cached(self):
+        self.response = {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "node is syncing"}}
+        middleware = self.build()
+        middleware("zks_L1ChainId", [])
+        middleware("zks_L1ChainId", [])
+        self.assertEqual(["zks_L1ChainId", "zks_L1ChainId"], self.calls)
+
+    def test_scope_miss(self):
+        self.build()("zks_L1ChainId", [])
+        reset_node_scope = SCOPE[:2] + ("0x" + "cd" * 32,)
+        self.build(scope=reset_node_scope)("zks_L1ChainId", [])
+        self.assertEqual(["zks_L1ChainId", "zks_L1ChainId"], self.calls)
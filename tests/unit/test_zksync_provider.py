@@ -0,0 +1,65 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from web3.types import RPCEndpoint
+from zksync2.module.zksync_provider import ZkSyncProvider
+
+
+class ZkSyncProviderTests(TestCase):
+
+    def setUp(self) -> None:
+        self.provider = ZkSyncProvider("http://127.0.0.1:3050")
+
+    def test_encode_rpc_request(self):
+        encoded = self.provider.encode_rpc_request(RPCEndpoint("eth_chainId"), None)
+        self.assertEqual({"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 0}, json.loads(encoded))
+
+    def test_encode_rpc_request_big_int(self):
+        value = 2 ** 64
+        encoded = self.provider.encode_rpc_request(RPCEndpoint("eth_call"), [{"value": value}])
+        self.assertEqual(value, json.loads(encoded)["params"][0]["value"])
+
+    def test_decode_rpc_response_big_int(self):
+        response = self.provider.decode_rpc_response(b'{"jsonrpc": "2.0", "id": 1, "result": 18446744073709551616}')
+        self.assertEqual(2 ** 64, response["result"])
+        self.assertIsInstance(response["result"], int)
+
+    def test_decode_rpc_response_invalid(self):
+        with self.assertRaises(json.JSONDecodeError):
+            self.provider.decode_rpc_response(b'not json')
+
+    def test_make_batch_request_orders_responses(self):
+        raw = b'[{"jsonrpc": "2.0", "id": 1, "result": "0x2"}, {"jsonrpc": "2.0", "id": 0, "result": "0x1"}]'
+        with patch("zksync2.module.zksync_provider.make_post_request", return_value=raw):
+            responses = self.provider.make_batch_request([(RPCEndpoint("eth_chainId"), []),
+                                                          (RPCEndpoint("zks_L1ChainId"), [])])
+        self.assertEqual(["0x1", "0x2"], [r["result"] for r in responses])
+
+    def test_make_batch_request_error(self):
+        raw = b'{"jsonrpc": "2.0", "id": null, "error": {"code": -32600, "message": "batch not supported"}}'
+        with patch("zksync2.module.zksync_provider.make_post_request", return_value=raw):
+            with self.assertRaises(ValueError) as ctx:
+                self.provider.make_batch_request([(RPCEndpoint("eth_chainId"), [])])
+        self.assertEqual({"code": -32600, "message": "batch not supported"}, ctx.exception.args[0])
+
+    def test_make_batch_request_null_id_error(self):
+        raw = b'[{"jsonrpc": "2.0", "id": 0, "result": "0x1"},' \
+              b' {"jsonrpc": "2.0", "id": null, "error": {"code": -32600, "message": "invalid request"}}]'
+        with patch("zksync2.module.zksync_provider.make_post_request", return_value=raw):
+            with self.assertRaises(ValueError) as ctx:
+                self.provider.make_batch_request([(RPCEndpoint("eth_chainId"), []),
+                                                  (RPCEndpoint("zks_L1ChainId"), [])])
+        self.assertEqual({"code": -32600, "message": "invalid request"}, ctx.exception.args[0])
+
+    def test_make_batch_request_unknown_id(self):
+        raw = b'[{"jsonrpc": "2.0", "id": 999, "result": "0x1"}]'
+        with patch("zksync2.module.zksync_provider.make_post_request", return_value=raw):
+            with self.assertRaises(ValueError):
+                self.provider.make_batch_request([(RPCEndpoint("eth_chainId"), [])])
+
+    def test_make_batch_request_missing_response(self):
+        raw = b'[{"jsonrpc": "2.0", "id": 0, "result": "0x1"}]'
+        with patch("zksync2.module.zksync_provider.make_post_request", return_value=raw):
+            with self.assertRaises(ValueError):
+                self.provider.make_batch_request([(RPCEndpoint("eth_chainId"), []),
+                                                  (RPCEndpoint("zks_L1ChainId"), [])])
@@ -27,6 +27,8 @@ class EthBlockParams(Enum):
 
 @dataclass
 class Token:
+    __slots__ = ("l1_address", "l2_address", "symbol", "decimals")
+
     l1_address: HexStr
     l2_address: HexStr
     symbol: str
@@ -45,10 +45,14 @@ class PrecomputeContractDeployer:
             abi = _icontract_deployer_abi_default()
         self.contract_encoder = BaseContractEncoder(self.web3, abi)
 
-    def encode_create2(self, bytecode: bytes,
+    def encode_create2(self, bytecode: Optional[bytes] = None,
                        call_data: Optional[bytes] = None,
-                       salt: Optional[bytes] = None) -> HexStr:
-
+                       salt: Optional[bytes] = None,
+                       *,
+                       bytecode_hash: Optional[bytes] = None) -> HexStr:
+        """
+        INFO: bytecode_hash, when given, must be equal to hash_byte_code(bytecode)
+        """
         if salt is None:
             salt = self.DEFAULT_SALT
         if call_data is None:
@@ -57,7 +61,7 @@ class PrecomputeContractDeployer:
         if len(salt) != 32:
             raise OverflowError("Salt data must be 32 length")
 
-        bytecode_hash = hash_byte_code(bytecode)
+        bytecode_hash = self._bytecode_hash(bytecode, bytecode_hash)
         args = salt, bytecode_hash, call_data
 
         return self.contract_encoder.encode_method(fn_name=self.CREATE2_FUNC, args=args)
@@ -114,15 +118,22 @@ class PrecomputeContractDeployer:
 
     def compute_l2_create2_address(self,
                                    sender: HexStr,
-                                   bytecode: bytes,
-                                   constructor: bytes,
-                                   salt: bytes) -> HexStr:
+                                   bytecode: Optional[bytes] = None,
+                                   constructor: bytes = EMPTY_BYTES,
+                                   salt: Optional[bytes] = None,
+                                   *,
+                                   bytecode_hash: Optional[bytes] = None) -> HexStr:
+        """
+        INFO: bytecode_hash, when given, must be equal to hash_byte_code(bytecode)
+        """
+        if salt is None:
+            salt = self.DEFAULT_SALT
         if len(salt) != 32:
             raise OverflowError("Salt data must be 32 length")
 
         sender_bytes = to_bytes(sender)
         sender_bytes = pad_front_bytes(sender_bytes, 32)
-        bytecode_hash = hash_byte_code(bytecode)
+        bytecode_hash = self._bytecode_hash(bytecode, bytecode_hash)
         ctor_hash = keccak(constructor)
         result = self.CREATE2_PREFIX + sender_bytes + salt + bytecode_hash + ctor_hash
         sha_result = keccak(result)
@@ -130,6 +141,14 @@ class PrecomputeContractDeployer:
         address = "0x" + address.hex()
         return HexStr(Web3.to_checksum_address(address))
 
+    @staticmethod
+    def _bytecode_hash(bytecode: Optional[bytes], bytecode_hash: Optional[bytes]) -> bytes:
+        if bytecode_hash is not None:
+            return bytecode_hash
+        if bytecode is None:
+            raise ValueError("Either bytecode or bytecode_hash must be provided")
+        return hash_byte_code(bytecode)
+
     def extract_contract_address(self, receipt: TxReceipt) -> HexStr:
         result = self.contract_encoder.contract.events.ContractDeployed().process_receipt(receipt, errors=DISCARD)
         entry = result[1]["args"]
@@ -277,6 +277,7 @@ class ZkSync(Eth, ABC):
         super(ZkSync, self).__init__(web3)
         self.main_contract_address = None
         self.bridge_addresses = None
+        self.l1_chain_id = None
 
     def zks_estimate_fee(self, transaction: Transaction) -> Fee:
         return self._zks_estimate_fee(transaction)
@@ -293,7 +294,9 @@ class ZkSync(Eth, ABC):
         return self._zks_get_token_price(token_address)
 
     def zks_l1_chain_id(self) -> int:
-        return self._zks_l1_chain_id()
+        if self.l1_chain_id is None:
+            self.l1_chain_id = self._zks_l1_chain_id()
+        return self.l1_chain_id
 
     def zks_get_all_account_balances(self, addr: Address) -> ZksAccountBalances:
         return self._zks_get_all_account_balances(addr)
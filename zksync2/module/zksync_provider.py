@@ -1,17 +1,76 @@
 import logging
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, List, Tuple
+from eth_utils import to_bytes
+from requests import Session
 from web3 import HTTPProvider
+from web3._utils.request import make_post_request
+from web3._utils.encoding import FriendlyJsonSerde
 from eth_typing import URI
 from web3.types import RPCEndpoint, RPCResponse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ZkSyncProvider(HTTPProvider):
     logger = logging.getLogger("ZkSyncProvider")
 
-    def __init__(self, url: Optional[Union[URI, str]]):
-        super(ZkSyncProvider, self).__init__(url, request_kwargs={'timeout': 1000})
+    def __init__(self, url: Optional[Union[URI, str]], session: Optional[Session] = None):
+        super(ZkSyncProvider, self).__init__(url, request_kwargs={'timeout': 1000}, session=session)
 
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         self.logger.debug(f"make_request: {method}, params : {params}")
         response = HTTPProvider.make_request(self, method, params)
         return response
+
+    @staticmethod
+    def _json_encode(obj: Any) -> bytes:
+        # INFO: orjson is optional and used for encoding only, its loads() turns ints over 64 bits into floats.
+        #       It can't encode ints over 64 bits either, those fall back to stdlib json
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj)
+            except TypeError:
+                pass
+        return to_bytes(text=FriendlyJsonSerde().json_encode(obj))
+
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        return self._json_encode({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        })
+
+    def encode_batch_rpc_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> Tuple[bytes, List[int]]:
+        rpc_list = [{
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        } for method, params in requests]
+        return self._json_encode(rpc_list), [rpc["id"] for rpc in rpc_list]
+
+    def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> List[RPCResponse]:
+        """
+        INFO: sends all requests as a single JSON-RPC batch,
+              responses are matched by id and returned in the same order as requests
+        """
+        self.logger.debug(f"make_batch_request: {requests}")
+        request_data, ids = self.encode_batch_rpc_request(requests)
+        raw_response = make_post_request(self.endpoint_uri, request_data, **self.get_request_kwargs())
+        responses = self.decode_rpc_response(raw_response)
+        # INFO: node may reject the whole batch with a single error object instead of a list
+        if not isinstance(responses, list):
+            raise ValueError(responses.get("error", responses))
+        by_id = {}
+        for response in responses:
+            # INFO: entries the node couldn't parse are answered with "id": null
+            if response.get("id") is None:
+                raise ValueError(response.get("error", response))
+            by_id[response["id"]] = response
+        if len(responses) != len(ids) or by_id.keys() != set(ids):
+            raise ValueError(f"Batch response ids {sorted(by_id)} don't match request ids {ids}")
+        return [by_id[i] for i in ids]
@@ -29,6 +29,10 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
         self.default_domain = make_domain(name=self._NAME,
                                           version=self._VERSION,
                                           chainId=self.chain_id)
+        # INFO: hash is reused only while signing against this very domain object,
+        #       an overridden domain property or reassigned default_domain is hashed again
+        self._hashed_domain = self.default_domain
+        self._default_domain_hash = self.default_domain.hash_struct()
 
     @property
     def address(self) -> ChecksumAddress:
@@ -39,10 +43,13 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
         return self.default_domain
 
     def typed_data_to_signed_bytes(self, typed_data: EIP712Struct, domain=None) -> SignableMessage:
-        d = domain
-        if d is None:
-            d = self.domain
-        msg = typed_data.signable_bytes(d)
+        if domain is None:
+            domain = self.domain
+        if domain is self._hashed_domain:
+            domain_hash = self._default_domain_hash
+        else:
+            domain_hash = domain.hash_struct()
+        msg = b'\x19\x01' + domain_hash + typed_data.hash_struct()
         return encode_defunct(msg)
 
     def sign_typed_data(self, typed_data: EIP712Struct, domain=None) -> SignedMessage:
@@ -3,7 +3,7 @@ from typing import Union, Optional
 import rlp
 from eth_account.datastructures import SignedMessage
 from eth_typing import ChecksumAddress, HexStr
-from eth_utils import remove_0x_prefix
+from eth_utils import remove_0x_prefix, keccak
 from rlp.sedes import big_endian_int, binary
 from rlp.sedes import List as rlpList
 from web3.types import Nonce
@@ -15,6 +15,36 @@ from zksync2.core.utils import to_bytes, hash_byte_code, encode_address, int_to_
 DynamicBytes = Bytes(0)
 
 
+def _transaction_struct() -> type:
+    class Transaction(EIP712Struct):
+        _type_hash = None
+
+        @classmethod
+        def type_hash(cls) -> bytes:
+            # INFO: struct schema is fixed, hash it only once
+            if cls._type_hash is None:
+                cls._type_hash = keccak(text=cls.encode_type())
+            return cls._type_hash
+
+    setattr(Transaction, 'txType',                   Uint(256))
+    setattr(Transaction, 'from',                     Uint(256))
+    setattr(Transaction, 'to',                       Uint(256))
+    setattr(Transaction, 'gasLimit',                Uint(256))
+    setattr(Transaction, 'gasPerPubdataByteLimit',   Uint(256))
+    setattr(Transaction, 'maxFeePerGas',             Uint(256))
+    setattr(Transaction, 'maxPriorityFeePerGas',     Uint(256))
+    setattr(Transaction, 'paymaster',                Uint(256))
+    setattr(Transaction, 'nonce',                    Uint(256))
+    setattr(Transaction, 'value',                    Uint(256))
+    setattr(Transaction, 'data',                     DynamicBytes)
+    setattr(Transaction, 'factoryDeps',              Array(Bytes(32)))
+    setattr(Transaction, 'paymasterInput',           DynamicBytes)
+    return Transaction
+
+
+_TRANSACTION_STRUCT = _transaction_struct()
+
+
 @dataclass
 class Transaction712:
     EIP_712_TX_TYPE = 113
@@ -101,9 +131,6 @@ class Transaction712:
         return int_to_bytes(self.EIP_712_TX_TYPE) + encoded_rlp
 
     def to_eip712_struct(self) -> EIP712Struct:
-        class Transaction(EIP712Struct):
-            pass
-
         paymaster: int = 0
         paymaster_params = self.meta.paymaster_params
         if paymaster_params is not None and paymaster_params.paymaster is not None:
@@ -116,20 +143,6 @@ class Transaction712:
         if factory_deps is not None and len(factory_deps):
             factory_deps_hashes = tuple([hash_byte_code(bytecode) for bytecode in factory_deps])
 
-        setattr(Transaction, 'txType',                   Uint(256))
-        setattr(Transaction, 'from',                     Uint(256))
-        setattr(Transaction, 'to',                       Uint(256))
-        setattr(Transaction, 'gasLimit',                Uint(256))
-        setattr(Transaction, 'gasPerPubdataByteLimit',   Uint(256))
-        setattr(Transaction, 'maxFeePerGas',             Uint(256))
-        setattr(Transaction, 'maxPriorityFeePerGas',     Uint(256))
-        setattr(Transaction, 'paymaster',                Uint(256))
-        setattr(Transaction, 'nonce',                    Uint(256))
-        setattr(Transaction, 'value',                    Uint(256))
-        setattr(Transaction, 'data',                     DynamicBytes)
-        setattr(Transaction, 'factoryDeps',              Array(Bytes(32)))
-        setattr(Transaction, 'paymasterInput',           DynamicBytes)
-
         paymaster_input = b''
         if paymaster_params is not None and \
                 paymaster_params.paymaster_input is not None:
@@ -150,6 +163,4 @@ class Transaction712:
             'factoryDeps': factory_deps_hashes,
             'paymasterInput': paymaster_input
         }
-        return Transaction(**kwargs)
-
-
+        return _TRANSACTION_STRUCT(**kwargs)
@@ -128,12 +128,16 @@ class TxCreate2Contract(TxBase, ABC):
                  call_data: Optional[bytes] = None,
                  value: int = 0,
                  max_priority_fee_per_gas=100_000_000,
-                 salt: Optional[bytes] = None
+                 salt: Optional[bytes] = None,
+                 bytecode_hash: Optional[bytes] = None
                  ):
+        # INFO: bytecode is shipped in factory_deps while the deploy call references bytecode_hash,
+        #       a precomputed hash must be equal to hash_byte_code(bytecode) or the node rejects the transaction
         contract_deployer = PrecomputeContractDeployer(web3)
         generated_call_data = contract_deployer.encode_create2(bytecode=bytecode,
                                                                call_data=call_data,
-                                                               salt=salt)
+                                                               salt=salt,
+                                                               bytecode_hash=bytecode_hash)
         factory_deps = []
         if deps is not None:
             for dep in deps: